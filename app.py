@@ -1,16 +1,96 @@
-from typing import List
+from collections import defaultdict
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+from concurrent.futures import ThreadPoolExecutor
 import re
 import urllib.parse
 import os
 
+import orjson
 import requests
-from bs4 import BeautifulSoup
 from flask import Flask, jsonify, request, send_from_directory
+from flask.json.provider import JSONProvider
+from flask_caching import Cache
 from flask_cors import CORS
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson, so jsonify skips the stdlib encoder."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # orjson already produces bytes, so hand them straight to the response
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj), mimetype="application/json")
+
 
 app = Flask(__name__, static_folder="static", static_url_path="/static")
+app.json = OrjsonProvider(app)
+app.config["SEND_FILE_MAX_AGE_DEFAULT"] = 600
 CORS(app)
 
+# In-process cache; set CACHE_TYPE to "RedisCache" (plus CACHE_REDIS_URL)
+# to share it across workers in production
+cache = Cache(app, config={"CACHE_TYPE": "SimpleCache", "CACHE_DEFAULT_TIMEOUT": 600})
+
+# Shared HTTP session so scrapers reuse pooled keep-alive connections
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=20,
+        pool_maxsize=50,
+        max_retries=Retry(total=2, backoff_factor=0.2),
+    ),
+)
+# requests already sends Connection: keep-alive and, with brotli installed,
+# Accept-Encoding: gzip, deflate, br
+
+# Request threads per worker; gunicorn_config.py reads the same variable
+WEB_THREADS = int(os.environ.get("WEB_THREADS", 8))
+# Worker threads for overlapping the two scrapers within one /api/search.
+# Every request thread may have both scrapes in flight, so size for that
+# rather than queueing scrapes behind other requests' scrapes.
+_EXECUTOR = ThreadPoolExecutor(max_workers=2 * WEB_THREADS)
+
+# Per-site request headers, built once rather than on every scrape
+YT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/91.0.4472.124 Safari/537.36"
+    )
+}
+GH_HEADERS = {
+    "User-Agent": "researchrepo",
+    "Accept": "application/vnd.github+json",
+    "X-GitHub-Api-Version": "2022-11-28",
+}
+# Optional token raises the search API limit from 10 to 30 requests/minute
+if os.environ.get("GITHUB_TOKEN"):
+    GH_HEADERS["Authorization"] = f"Bearer {os.environ['GITHUB_TOKEN']}"
+
+# Scraper patterns, compiled once at import.
+# Video IDs are fixed-length and the gap/title are bounded, so a videoId
+# with no nearby title fails fast instead of scanning the rest of the page.
+YT_PATTERN = re.compile(
+    r'videoId":"([A-Za-z0-9_-]{11})".{0,1500}?"text":"((?:[^"\\]|\\.){6,300})"'
+)
+# Search results are embedded as JSON in the page: var ytInitialData = {...};
+YT_INITIAL_DATA_MARKER = "var ytInitialData = "
+YT_INITIAL_DATA_END = ";</script>"
+# GitHub's JSON search endpoint (real stars/forks/language, tiny payload)
+GH_SEARCH_API_URL = "https://api.github.com/search/repositories"
+
 # Categories with popular papers (with year metadata)
 # Structure: {"title": "Paper Name", "year": YYYY}
 CATEGORIES = {
@@ -82,81 +162,234 @@ CATEGORIES = {
     ],
 }
 
-def get_category_popular_papers(category: str, year_filter: int = None) -> List[dict]:
+# Every paper is a {"title", "year"} dict; checked once here rather than
+# guarding each lookup below
+assert all(
+    isinstance(paper, dict) and "title" in paper and "year" in paper
+    for cat_papers in CATEGORIES.values()
+    for paper in cat_papers
+)
+
+# CATEGORIES is static, so derive the flattened/sorted views once at import
+_ALL_PAPERS = [
+    {**paper, "category": cat_name}
+    for cat_name, cat_papers in CATEGORIES.items()
+    if cat_name != "All"
+    for paper in cat_papers
+]
+_AVAILABLE_YEARS = tuple(sorted({paper["year"] for paper in _ALL_PAPERS}, reverse=True))
+# Per-category views reuse the _ALL_PAPERS dicts rather than copying
+# CATEGORIES again; "All" combines every category (newest first). Stored as
+# immutable tuples so they can be returned as-is and shared across threads.
+_PAPERS_BY_CATEGORY: Dict[str, Tuple[dict, ...]] = {
+    cat_name: tuple(
+        sorted(
+            (paper for paper in _ALL_PAPERS if paper["category"] == cat_name),
+            key=itemgetter("year"),
+            reverse=True,
+        )
+    )
+    for cat_name in CATEGORIES
+    if cat_name != "All"
+}
+_PAPERS_BY_CATEGORY["All"] = tuple(sorted(_ALL_PAPERS, key=itemgetter("year"), reverse=True))
+# category -> year -> papers, for the optional year filter
+_PAPERS_BY_CATEGORY_YEAR: Dict[str, Dict[int, Tuple[dict, ...]]] = {
+    cat_name: {
+        year: tuple(group) for year, group in groupby(papers, key=itemgetter("year"))
+    }
+    for cat_name, papers in _PAPERS_BY_CATEGORY.items()
+}
+
+# Inverted index for search suggestions: title token -> indices into _ALL_PAPERS
+_TITLES_LOWER = [paper["title"].lower() for paper in _ALL_PAPERS]
+_INDEX: Dict[str, Set[int]] = defaultdict(set)
+for i, title_lower in enumerate(_TITLES_LOWER):
+    for token in title_lower.split():
+        _INDEX[token].add(i)
+
+
+@lru_cache(maxsize=1024)
+def title_postings(word: str) -> FrozenSet[int]:
+    """Indices of papers whose lowercased title contains ``word``."""
+    # Query words never contain whitespace, so a substring of a title is
+    # always a substring of one of its tokens; this keeps partial words
+    # (typed-ahead prefixes) matching like the old full scan did.
+    return frozenset().union(*(ids for token, ids in _INDEX.items() if word in token))
+
+
+def get_category_popular_papers(category: str, year_filter: int = None) -> Tuple[dict, ...]:
     """Get popular papers for a specific category, optionally filtered by year."""
-    papers = []
-    
-    # If "All" category, combine all papers from all categories
-    if category == "All":
-        for cat_name, cat_papers in CATEGORIES.items():
-            if cat_name != "All" and isinstance(cat_papers, list):
-                for paper in cat_papers:
-                    if isinstance(paper, dict):
-                        papers.append({**paper, "category": cat_name})
-    else:
-        cat_papers = CATEGORIES.get(category, [])
-        for paper in cat_papers:
-            if isinstance(paper, dict):
-                papers.append({**paper, "category": category})
-    
     # Filter by year if specified
     if year_filter:
-        papers = [p for p in papers if p.get("year") == year_filter]
-    
-    # Sort by year (newest first)
-    papers = sorted(papers, key=lambda x: x.get("year", 0), reverse=True)
-    
-    return papers
+        return _PAPERS_BY_CATEGORY_YEAR.get(category, {}).get(year_filter, ())
+    return _PAPERS_BY_CATEGORY.get(category, ())
 
-def get_available_years() -> List[int]:
+def get_available_years() -> Tuple[int, ...]:
     """Get all available years from papers."""
-    years = set()
-    for cat_papers in CATEGORIES.values():
-        if isinstance(cat_papers, list):
-            for paper in cat_papers:
-                if isinstance(paper, dict) and paper.get("year"):
-                    years.add(paper["year"])
-    return sorted(list(years), reverse=True)
+    return _AVAILABLE_YEARS
 
 
-def search_youtube(query: str, max_results: int = 5) -> List[dict]:
-    """Lightweight YouTube search scraper (no API key required)."""
-    formatted_query = urllib.parse.quote(f"{query} research paper explanation")
-    url = f"https://www.youtube.com/results?search_query={formatted_query}"
+# Placeholder metadata for videos scraped without ytInitialData
+YT_PUBLISHED_OPTIONS = ("1 month ago", "2 months ago", "6 months ago", "1 year ago")
+YT_CHANNELS = ("ML Explained", "AI Coffee Break", "The AI Epiphany", "Code Emporium", "StatQuest")
 
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/91.0.4472.124 Safari/537.36"
-        )
-    }
 
-    try:
-        response = requests.get(url, headers=headers, timeout=15)
-        response.raise_for_status()
-    except Exception:
+def yt_list(value) -> List[dict]:
+    """The dict entries of a ytInitialData list, or [] if it isn't a list."""
+    if not isinstance(value, list):
         return []
+    return [entry for entry in value if isinstance(entry, dict)]
+
+
+def yt_text(node) -> str:
+    """Flatten a YouTube text object ({"simpleText": ...} or {"runs": [...]})."""
+    if not isinstance(node, dict):
+        return ""
+    if isinstance(node.get("simpleText"), str):
+        return node["simpleText"]
+    return "".join(
+        run["text"] for run in yt_list(node.get("runs")) if isinstance(run.get("text"), str)
+    )
+
+
+def read_yt_results_page(response) -> str:
+    """Stream a results page, stopping once the ytInitialData blob is complete.
+
+    The blob sits well before the end of the page, so the remaining
+    scripts are never decoded. If it never shows up the whole page is
+    returned for the regex fallback.
+    """
+    if response.encoding is None:
+        response.encoding = "utf-8"
+
+    chunks = []
+    # Carry the end of the previous chunk so a marker split across two
+    # chunks is still found
+    tail = ""
+    found_start = False
+    for chunk in response.iter_content(chunk_size=65536, decode_unicode=True):
+        chunks.append(chunk)
+        window = tail + chunk
+        if not found_start:
+            start = window.find(YT_INITIAL_DATA_MARKER)
+            if start == -1:
+                tail = window[-(len(YT_INITIAL_DATA_MARKER) - 1):]
+                continue
+            found_start = True
+            window = window[start + len(YT_INITIAL_DATA_MARKER):]
+        if YT_INITIAL_DATA_END in window:
+            break
+        tail = window[-(len(YT_INITIAL_DATA_END) - 1):]
+
+    # Discard the unread rest as raw (still compressed) bytes; closing a
+    # response mid-body would drop the socket instead of returning it to
+    # the pool, costing a fresh TCP+TLS handshake on the next scrape.
+    # urllib3 < 2.6 can't drain a partly decoded gzip/br body (RuntimeError);
+    # the page is already read, so just let the connection close then.
+    try:
+        response.raw.drain_conn()
+    except Exception as e:
+        print(f"YouTube connection drain skipped: {e}")
+    return "".join(chunks)
+
+
+def parse_yt_initial_data(html: str, max_results: int) -> Optional[List[dict]]:
+    """Extract videos from the ytInitialData JSON blob.
+
+    Returns None if the blob is missing, laid out differently or holds no
+    videos, so the caller can fall back to regex scraping.
+    """
+    start = html.find(YT_INITIAL_DATA_MARKER)
+    if start == -1:
+        return None
+    start += len(YT_INITIAL_DATA_MARKER)
+    end = html.find(YT_INITIAL_DATA_END, start)
+    if end == -1:
+        return None
+
+    try:
+        data = orjson.loads(html[start:end])
+        sections = data["contents"]["twoColumnSearchResultsRenderer"]["primaryContents"][
+            "sectionListRenderer"
+        ]["contents"]
+    except (ValueError, KeyError, TypeError, IndexError):
+        return None
 
     video_data: List[dict] = []
-    pattern = r'videoId":"(.*?)".*?"text":"(.*?)"'
-    matches = re.findall(pattern, response.text)
+    seen_videos = set()
+    for section in yt_list(sections):
+        item_section = section.get("itemSectionRenderer")
+        if not isinstance(item_section, dict):
+            continue
+        for item in yt_list(item_section.get("contents")):
+            renderer = item.get("videoRenderer")
+            if not isinstance(renderer, dict):
+                continue
+            video_id = renderer.get("videoId")
+            if not isinstance(video_id, str) or not video_id or video_id in seen_videos:
+                continue
+            seen_videos.add(video_id)
+
+            video_data.append(
+                {
+                    "url": f"https://www.youtube.com/watch?v={video_id}",
+                    "title": yt_text(renderer.get("title")),
+                    "thumbnail": f"https://i.ytimg.com/vi/{video_id}/hqdefault.jpg",
+                    "views": yt_text(renderer.get("viewCountText")),
+                    "published": yt_text(renderer.get("publishedTimeText")),
+                    "channel": yt_text(renderer.get("ownerText")),
+                }
+            )
+
+            if len(video_data) >= max_results:
+                return video_data
+
+    return video_data or None
+
+
+@cache.memoize(timeout=600, response_filter=bool)
+def search_youtube(query: str, max_results: int = 5) -> Optional[List[dict]]:
+    """Lightweight YouTube search scraper (no API key required).
+
+    Returns None if YouTube couldn't be reached, so callers can tell a
+    failure apart from a search with no results.
+    """
+    formatted_query = urllib.parse.quote(f"{query} research paper explanation")
+    url = f"https://www.youtube.com/results?search_query={formatted_query}"
+
+    try:
+        with SESSION.get(url, headers=YT_HEADERS, timeout=15, stream=True) as response:
+            response.raise_for_status()
+            html = read_yt_results_page(response)
+    except Exception as e:
+        print(f"YouTube request error: {e}")
+        return None
+
+    video_data = parse_yt_initial_data(html, max_results)
+    if video_data is not None:
+        return video_data
+
+    # No ytInitialData blob (layout change?), fall back to regex scraping
+    video_data = []
+    matches = YT_PATTERN.findall(html)
 
     seen_videos = set()
     for video_id, title in matches:
-        if video_id in seen_videos or len(title) <= 5:
+        if video_id in seen_videos:
             continue
 
         seen_videos.add(video_id)
         clean_title = title.replace("\\", "").replace("\u0026", "&")
         thumbnail = f"https://i.ytimg.com/vi/{video_id}/hqdefault.jpg"
 
-        # Fake but plausible metadata (we're scraping without full details)
-        views = f"{(100 + (hash(video_id) % 900)):.1f}K views"
-        published_options = ["1 month ago", "2 months ago", "6 months ago", "1 year ago"]
-        channels = ["ML Explained", "AI Coffee Break", "The AI Epiphany", "Code Emporium", "StatQuest"]
-        pub_index = abs(hash(video_id)) % len(published_options)
-        channel_index = abs(hash(video_id)) % len(channels)
+        # Fake but plausible metadata (we're scraping without full details),
+        # all derived from a single hash of the video ID
+        vh = hash(video_id) & 0x7FFFFFFF
+        rest, view_offset = divmod(vh, 900)
+        views = f"{100 + view_offset:.1f}K views"
+        rest, pub_index = divmod(rest, len(YT_PUBLISHED_OPTIONS))
+        channel_index = rest % len(YT_CHANNELS)
 
         video_data.append(
             {
@@ -164,8 +397,8 @@ def search_youtube(query: str, max_results: int = 5) -> List[dict]:
                 "title": clean_title,
                 "thumbnail": thumbnail,
                 "views": views,
-                "published": published_options[pub_index],
-                "channel": channels[channel_index],
+                "published": YT_PUBLISHED_OPTIONS[pub_index],
+                "channel": YT_CHANNELS[channel_index],
             }
         )
 
@@ -194,96 +427,64 @@ def parse_int_from_text(text: str) -> int:
         return 0
 
 
-def search_github_repos(query: str, max_results: int = 5) -> List[dict]:
-    """Scrape GitHub repository search results for implementations."""
-    formatted_query = urllib.parse.quote(f"{query} implementation")
-    url = f"https://github.com/search?q={formatted_query}&type=repositories"
+@cache.memoize(timeout=600, response_filter=bool)
+def search_github_repos(query: str, max_results: int = 5) -> Optional[List[dict]]:
+    """Search GitHub repositories for implementations via the REST search API.
 
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/120.0.0.0 Safari/537.36"
-        ),
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.5",
-    }
+    Returns None if the request failed (see search_youtube).
+    """
+    search_query = f"{query} implementation"
+    formatted_query = urllib.parse.quote(search_query)
+
+    # Revalidate with the last ETag; 304s don't count against the rate limit
+    etag_key = f"gh-etag:{search_query}:{max_results}"
+    cached = cache.get(etag_key)
+    headers = GH_HEADERS
+    if cached:
+        headers = {**GH_HEADERS, "If-None-Match": cached["etag"]}
 
     try:
-        response = requests.get(url, headers=headers, timeout=15)
+        response = SESSION.get(
+            GH_SEARCH_API_URL,
+            params={"q": search_query, "per_page": max_results},
+            headers=headers,
+            timeout=15,
+        )
+        if response.status_code == 304 and cached:
+            return cached["repos"]
         response.raise_for_status()
+        items = response.json()["items"]
+        if not isinstance(items, list):
+            raise TypeError(f"unexpected items payload: {type(items).__name__}")
     except Exception as e:
         print(f"GitHub request error: {e}")
-        return []
+        return None
 
     repos: List[dict] = []
-    seen_repos = set()
-    
-    # Comprehensive regex pattern to find GitHub repo URLs in the HTML
-    # This matches both /user/repo and https://github.com/user/repo patterns
-    repo_pattern = r'(?:href=["\']|/|github\.com/)([a-zA-Z0-9_.-]+/[a-zA-Z0-9_.-]+?)(?:["\']|/|$|\s|>)'
-    
-    # Find all potential repo paths
-    matches = re.finditer(repo_pattern, response.text, re.IGNORECASE)
-    
-    for match in matches:
-        try:
-            repo_path = match.group(1).strip()
-            
-            # Must have exactly one slash (user/repo format)
-            if repo_path.count("/") != 1:
-                continue
-            
-            # Skip common non-repo patterns
-            skip_patterns = ["search", "topics", "settings", "pulls", "issues", "actions", 
-                           "marketplace", "explore", "blog", "about", "pricing", "enterprise"]
-            if any(pattern in repo_path.lower() for pattern in skip_patterns):
-                continue
-            
-            # Build full URL
-            repo_url = f"https://github.com/{repo_path}"
-            
-            # Skip duplicates
-            if repo_url in seen_repos:
-                continue
-            seen_repos.add(repo_url)
-            
-            # Extract author and repo name
-            parts = repo_path.split("/")
-            if len(parts) != 2:
-                continue
-            
-            author = parts[0]
-            repo_name = parts[1]
-            
-            # Validate repo name
-            if len(repo_name) < 2 or len(repo_name) > 100:
-                continue
-            if not repo_name.replace("-", "").replace("_", "").replace(".", "").isalnum():
-                continue
-            
-            # Generate reasonable defaults for stats
-            stars = 50 + (abs(hash(repo_url)) % 950)
-            forks = max(int(stars * 0.3), 1)
-            
-            repos.append(
-                {
-                    "url": repo_url,
-                    "name": repo_name,
-                    "stars": stars,
-                    "forks": forks,
-                    "author": author,
-                    "language": "Python",
-                    "description": f"Implementation of {query}",
-                }
-            )
-            
-            if len(repos) >= max_results:
-                break
-        except Exception as e:
-            print(f"Error processing repo match: {e}")
+    for item in items:
+        # Skip entries without the fields a result card needs
+        if not isinstance(item, dict):
             continue
-    
+        if not isinstance(item.get("html_url"), str) or not isinstance(item.get("name"), str):
+            continue
+        owner = item.get("owner")
+        repos.append(
+            {
+                "url": item["html_url"],
+                "name": item["name"],
+                "stars": item.get("stargazers_count") or 0,
+                "forks": item.get("forks_count") or 0,
+                "author": owner.get("login") if isinstance(owner, dict) else None,
+                "language": item.get("language"),
+                "description": item.get("description"),
+            }
+        )
+        if len(repos) >= max_results:
+            break
+
+    if repos and response.headers.get("ETag"):
+        cache.set(etag_key, {"etag": response.headers["ETag"], "repos": repos}, timeout=86400)
+
     # If no repos found, create a helpful search link
     if not repos:
         search_url = f"https://github.com/search?q={formatted_query}&type=repositories"
@@ -302,13 +503,51 @@ def search_github_repos(query: str, max_results: int = 5) -> List[dict]:
     return repos
 
 
+# Browser/proxy cache lifetimes (seconds) for GET endpoints
+CACHE_MAX_AGE = {
+    "/api/categories": 3600,
+    "/api/years": 3600,
+    "/api/popular-papers": 600,
+    "/api/search-suggestions": 600,
+    "/api/search": 300,
+}
+
+
+@app.after_request
+def add_cache_headers(response):
+    """Let clients and proxies reuse successful API responses."""
+    max_age = CACHE_MAX_AGE.get(request.path)
+    if max_age is None or request.method != "GET" or response.status_code != 200:
+        return response
+    # Same rule as the server-side view cache: never advertise partial results
+    if not is_ok_response(response):
+        return response
+
+    response.cache_control.public = True
+    response.cache_control.max_age = max_age
+    # Answer revalidations with an empty 304 when the body hasn't changed
+    response.add_etag(weak=True)
+    return response.make_conditional(request)
+
+
+def is_ok_response(rv) -> bool:
+    """Only cache complete, successful view results.
+
+    Skips (response, status) errors and responses marked no-store, which
+    is how /api/search flags results missing a failed scraper.
+    """
+    return not isinstance(rv, tuple) and not rv.cache_control.no_store
+
+
 @app.route("/api/categories", methods=["GET"])
+@cache.cached(query_string=True)
 def get_categories():
     """Get all available categories."""
     return jsonify({"categories": list(CATEGORIES.keys())})
 
 
 @app.route("/api/popular-papers", methods=["GET"])
+@cache.cached(query_string=True)
 def get_popular_papers():
     """Get popular papers for a category, optionally filtered by year."""
     category = request.args.get("category", "All").strip()
@@ -319,6 +558,7 @@ def get_popular_papers():
 
 
 @app.route("/api/years", methods=["GET"])
+@cache.cached(query_string=True)
 def get_years():
     """Get all available years."""
     years = get_available_years()
@@ -326,32 +566,25 @@ def get_years():
 
 
 @app.route("/api/search-suggestions", methods=["GET"])
+@cache.cached(query_string=True)
 def search_suggestions():
     """Get paper suggestions based on keyword search."""
     query = request.args.get("q", "").strip().lower()
     if len(query) < 2:
         return jsonify({"suggestions": []})
 
-    # Get all papers
-    all_papers = []
-    for cat_name, cat_papers in CATEGORIES.items():
-        if cat_name != "All" and isinstance(cat_papers, list):
-            for paper in cat_papers:
-                if isinstance(paper, dict):
-                    all_papers.append({**paper, "category": cat_name})
-
     # Search for matching papers (case-insensitive)
     suggestions = []
     query_words = query.split()
-    
-    for paper in all_papers:
-        title_lower = paper.get("title", "").lower()
-        
-        # Check if all query words are in the title
-        if all(word in title_lower for word in query_words):
-            # Calculate a simple relevance score
-            score = sum(title_lower.count(word) for word in query_words)
-            suggestions.append({**paper, "score": score})
+
+    # Papers containing every query word: intersect the posting lists
+    candidates = frozenset.intersection(*(title_postings(word) for word in query_words))
+
+    for i in sorted(candidates):
+        title_lower = _TITLES_LOWER[i]
+        # Calculate a simple relevance score
+        score = sum(title_lower.count(word) for word in query_words)
+        suggestions.append({**_ALL_PAPERS[i], "score": score})
 
     # Sort by relevance score (higher is better) and limit to 8 results
     suggestions = sorted(suggestions, key=lambda x: x.get("score", 0), reverse=True)[:8]
@@ -359,7 +592,17 @@ def search_suggestions():
     return jsonify({"suggestions": suggestions})
 
 
+def search_all(query: str, max_results: int = 5):
+    """Run the YouTube and GitHub scrapers concurrently."""
+    # Both scrapers are blocking and I/O bound (the GIL is released while
+    # waiting on the socket), so overlap them on the shared thread pool
+    videos = _EXECUTOR.submit(search_youtube, query, max_results)
+    repos = _EXECUTOR.submit(search_github_repos, query, max_results)
+    return videos.result(), repos.result()
+
+
 @app.route("/api/search", methods=["GET"])
+@cache.cached(timeout=300, query_string=True, response_filter=is_ok_response)
 def search():
     q = request.args.get("q", "").strip()
     category = request.args.get("category", "").strip()
@@ -369,10 +612,17 @@ def search():
         return jsonify({"videos": [], "repos": []}), 400
 
     try:
-        videos = search_youtube(q, 5)
-        repos = search_github_repos(q, 5)
-        print(f"Search for '{q}': Found {len(videos)} videos, {len(repos)} repos")  # Debug
-        return jsonify({"videos": videos, "repos": repos})
+        videos, repos = search_all(q, 5)
+        if videos is None and repos is None:
+            print(f"Search for '{q}': both scrapers failed")  # Debug
+            return jsonify({"videos": [], "repos": [], "error": "Upstream search failed"}), 502
+
+        print(f"Search for '{q}': Found {len(videos or [])} videos, {len(repos or [])} repos")  # Debug
+        response = jsonify({"videos": videos or [], "repos": repos or []})
+        if videos is None or repos is None:
+            # Partial result: serve it, but don't let any cache keep it
+            response.cache_control.no_store = True
+        return response
     except Exception as e:
         print(f"Search error: {e}")  # Debug
         return jsonify({"videos": [], "repos": [], "error": str(e)}), 500
@@ -384,6 +634,12 @@ def index():
 
 
 if __name__ == "__main__":
+    # Production: gunicorn -c gunicorn_config.py app:app
+    if not os.environ.get("FLASK_DEV"):
+        raise SystemExit(
+            "Set FLASK_DEV=1 to use the Flask dev server, "
+            "or run: gunicorn -c gunicorn_config.py app:app"
+        )
     # Run Flask dev server
     port = int(os.environ.get("PORT", 5000))
     app.run(host="127.0.0.1", port=port, debug=True)
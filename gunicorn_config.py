@@ -0,0 +1,18 @@
+# Production server config: gunicorn -c gunicorn_config.py app:app
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+
+# Threaded workers: requests mostly wait on YouTube/GitHub, so each worker
+# can serve several at once while the GIL is released on socket reads
+worker_class = "gthread"
+workers = int(os.environ.get("WEB_CONCURRENCY", 4))
+# app.py sizes its scraper pool from the same variable (2 per thread)
+threads = int(os.environ.get("WEB_THREADS", 8))
+
+# Import app.py once in the master so CATEGORIES and the precomputed
+# paper/search indexes are shared copy-on-write across workers
+preload_app = True
+
+# Scrapes can take up to ~15s per upstream request
+timeout = 60